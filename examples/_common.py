@@ -0,0 +1,73 @@
+"""
+Shared helpers for the agentsh examples.
+
+Each example imports what it needs from here instead of redefining the
+binary path, server setup, and tool-call helpers.
+"""
+
+import asyncio
+import sys
+from contextlib import nullcontext
+from pathlib import Path
+from weakref import WeakKeyDictionary
+
+try:
+    import uvloop
+    run = uvloop.run
+except ImportError:
+    run = asyncio.run
+
+try:
+    from orjson import loads as _loads
+except ImportError:
+    from json import loads as _loads
+
+# Path to the agentsh binary (built with `cargo build --release`).
+AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
+AGENTSH_BIN_STR = str(AGENTSH_BIN)
+
+_BAR = "=" * 60
+
+# Tool name -> tool, per server. Weak keys so closed servers are dropped.
+_tool_maps: WeakKeyDictionary = WeakKeyDictionary()
+
+
+def agentsh_server(server=None):
+    """Return `server` as a no-op context manager, or a new agentsh server if None."""
+    if server is not None:
+        return nullcontext(server)
+    # Imported here so scripts can fail fast before loading the SDK.
+    from agents.mcp import MCPServerStdio
+
+    return MCPServerStdio(
+        name="agentsh",
+        params={"command": AGENTSH_BIN_STR, "args": []},
+        cache_tools_list=True,
+    )
+
+
+async def warm_up(server) -> dict:
+    """Fetch and memoize the server's tools so the first real call skips discovery."""
+    tools = _tool_maps.get(server)
+    if tools is None:
+        tools = {tool.name: tool for tool in await server.list_tools()}
+        _tool_maps[server] = tools
+    return tools
+
+
+async def call_raw(server, tool: str, args: dict) -> str:
+    """Return raw text (for error messages that aren't JSON)."""
+    if tool not in await warm_up(server):
+        raise ValueError(f"agentsh has no tool named {tool!r}")
+    result = await server.call_tool(tool, args)
+    return result.content[0].text
+
+
+async def call(server, tool: str, args: dict) -> dict:
+    """Call an agentsh tool and return the parsed JSON result."""
+    return _loads(await call_raw(server, tool, args))
+
+
+def banner(title: str) -> None:
+    """Print a section header between two separator bars."""
+    sys.stdout.write(f"{_BAR}\n{title}\n{_BAR}\n")
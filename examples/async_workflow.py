@@ -8,113 +8,99 @@ No API key needed.
 Usage:
   cargo build --release
   pip install openai-agents
+  pip install uvloop orjson  # optional, faster event loop and JSON parsing
   python examples/async_workflow.py
 """
 
 import asyncio
-import json
-from pathlib import Path
+import sys
 
-from agents.mcp import MCPServerStdio
+from _common import agentsh_server, banner, call, run, warm_up
 
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
+# One row of the list_commands listing; `.50` truncates the command.
+COMMAND_ROW = "  [{status:>10}] {id}: {command:.50}\n".format
 
 
-async def call(server, tool: str, args: dict) -> dict:
-    result = await server.call_tool(tool, args)
-    return json.loads(result.content[0].text)
-
-
-async def main() -> None:
-    async with MCPServerStdio(
-        name="agentsh",
-        params={"command": str(AGENTSH_BIN), "args": []},
-    ) as server:
+async def main(server=None) -> None:
+    async with agentsh_server(server) as server:
+        await warm_up(server)
 
         # 1. Start a background command
-        print("=" * 60)
-        print("1. Start a background command")
-        print("=" * 60)
+        banner("1. Start a background command")
         start_result = await call(server, "start_command", {
             "command": "sleep 2 && echo 'background task done'",
             "id": "bg-task-1",
         })
         print(f"  Started: id={start_result['id']}, status={start_result['status']}")
+        # Submit the wait now so the server is already blocking on bg-task-1
+        # while we check its status and do other work below.
+        wait_fut = asyncio.create_task(call(server, "wait_command", {"id": "bg-task-1"}))
         print()
 
         # 2. Check status while it's running
-        print("=" * 60)
-        print("2. Check status (should be running)")
-        print("=" * 60)
+        banner("2. Check status (should be running)")
         status = await call(server, "get_status", {"id": "bg-task-1"})
         print(f"  Status: {status['status']}")
         print(f"  Runtime: {status['runtime_seconds']:.1f}s")
         print()
 
         # 3. Do other work in the meantime
-        print("=" * 60)
-        print("3. Do other work while bg-task-1 runs")
-        print("=" * 60)
+        banner("3. Do other work while bg-task-1 runs")
         other = await call(server, "run_command", {
             "command": "echo 'doing other work while background task runs'",
+            "max_output_lines": 1,
         })
         print(f"  Other work result: {other['output_head']}")
         print()
 
         # 4. Wait for the background command to finish
-        print("=" * 60)
-        print("4. Wait for bg-task-1 to complete")
-        print("=" * 60)
-        wait_result = await call(server, "wait_command", {"id": "bg-task-1"})
+        banner("4. Wait for bg-task-1 to complete")
+        wait_result = await wait_fut
         print(f"  Exit code: {wait_result['exit_code']}")
         print(f"  Duration:  {wait_result['duration_seconds']:.1f}s")
         print(f"  Output:    {wait_result['output_head']}")
         print()
 
         # 5. Check status after completion
-        print("=" * 60)
-        print("5. Check status (should be completed)")
-        print("=" * 60)
+        banner("5. Check status (should be completed)")
         status = await call(server, "get_status", {"id": "bg-task-1"})
         print(f"  Status: {status['status']}")
         print()
 
         # 6. Run multiple commands in parallel
-        print("=" * 60)
-        print("6. Run 3 commands in parallel")
-        print("=" * 60)
+        banner("6. Run 3 commands in parallel")
         # Start 3 commands
-        for i in range(1, 4):
-            await call(server, "start_command", {
+        started = await asyncio.gather(*[
+            call(server, "start_command", {
                 "command": f"sleep {i} && echo 'task {i} done after {i}s'",
                 "id": f"parallel-{i}",
             })
+            for i in range(1, 4)
+        ])
         print("  Started 3 parallel tasks")
 
-        # List all commands
-        commands = await call(server, "list_commands", {})
-        running = [c for c in commands if c["status"] == "running"]
+        # start_command already reports each status; the full listing is
+        # fetched once in step 7, after the waits below.
+        running = [r for r in started if r["status"] == "running"]
         print(f"  Running: {len(running)} commands")
 
         # Wait for all
-        for i in range(1, 4):
-            result = await call(server, "wait_command", {"id": f"parallel-{i}"})
+        waiters = [call(server, "wait_command", {"id": f"parallel-{i}"}) for i in range(1, 4)]
+        results = await asyncio.gather(*waiters)
+        for i, result in enumerate(results, 1):
             print(f"  parallel-{i}: exit={result['exit_code']}, "
                   f"duration={result['duration_seconds']:.1f}s, "
                   f"output={result['output_head']}")
         print()
 
         # 7. Final listing
-        print("=" * 60)
-        print("7. List all tracked commands")
-        print("=" * 60)
+        banner("7. List all tracked commands")
         commands = await call(server, "list_commands", {})
-        for cmd in commands:
-            print(f"  [{cmd['status']:>10}] {cmd['id']}: {cmd['command'][:50]}")
+        sys.stdout.write("".join(COMMAND_ROW(**cmd) for cmd in commands))
         print()
 
         print("All async workflow examples completed successfully!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
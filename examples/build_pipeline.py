@@ -2,34 +2,35 @@
 Example: practical build/test pipeline.
 
 Simulates what an LLM agent would actually do: run a multi-step build pipeline
-where each step depends on the previous one, check for errors, and report results.
+(running independent steps concurrently), check for errors, and report results.
 No API key needed.
 
 Usage:
   cargo build --release
   pip install openai-agents
+  pip install uvloop orjson  # optional, faster event loop and JSON parsing
   python examples/build_pipeline.py
 """
 
 import asyncio
-import json
+import re
 import sys
 from pathlib import Path
 
-from agents.mcp import MCPServerStdio
+from _common import AGENTSH_BIN, agentsh_server, banner, call, run, warm_up
 
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
-
-
-async def call(server, tool: str, args: dict) -> dict:
-    result = await server.call_tool(tool, args)
-    return json.loads(result.content[0].text)
+# Matches cargo's per-crate test summary lines.
+TEST_RESULT_RE = re.compile(r"test result:")
 
 
 async def run_step(server, name: str, command: str, **kwargs) -> dict:
-    """Run a pipeline step and print status."""
+    """Run a pipeline step and return its result; status is printed by report_step."""
     print(f"  [{name}] Running: {command}")
-    result = await call(server, "run_command", {"command": command, **kwargs})
+    return await call(server, "run_command", {"command": command, **kwargs})
+
+
+def report_step(name: str, result: dict) -> None:
+    """Print the status of a finished pipeline step."""
     status = "OK" if result["exit_code"] == 0 else "FAIL"
     print(f"  [{name}] {status} (exit={result['exit_code']}, "
           f"{result['duration_seconds']:.2f}s, {result['total_lines']} lines)")
@@ -37,18 +38,13 @@ async def run_step(server, name: str, command: str, **kwargs) -> dict:
     if result["exit_code"] != 0 and result["output_error_lines"]:
         for err in result["output_error_lines"][:5]:
             print(f"  [{name}] ERROR: {err}")
-    return result
 
 
-async def main() -> None:
-    async with MCPServerStdio(
-        name="agentsh",
-        params={"command": str(AGENTSH_BIN), "args": []},
-    ) as server:
+async def main(server=None) -> None:
+    async with agentsh_server(server) as server:
+        await warm_up(server)
 
-        print("=" * 60)
-        print("Pipeline: Build and test agentsh itself")
-        print("=" * 60)
+        banner("Pipeline: Build and test agentsh itself")
         print()
 
         project_dir = str(Path(__file__).parent.parent)
@@ -58,6 +54,7 @@ async def main() -> None:
             server, "TOOLCHAIN", "rustc --version && cargo --version",
             working_directory=project_dir,
         )
+        report_step("TOOLCHAIN", result)
         if result["exit_code"] != 0:
             print("\n  Pipeline aborted: Rust toolchain not available")
             return
@@ -65,67 +62,81 @@ async def main() -> None:
             print(f"    {line}")
         print()
 
-        # Step 2: Format check
-        result = await run_step(
+        # Steps 2 + 3: Format check and clippy lint don't depend on each
+        # other, so run them concurrently and report once both finish.
+        fmt_task = asyncio.create_task(run_step(
             server, "FMT CHECK", "cargo fmt -- --check",
             working_directory=project_dir,
-        )
-        if result["exit_code"] != 0:
+            max_output_lines=0,
+        ))
+        clippy_task = asyncio.create_task(run_step(
+            server, "CLIPPY", "cargo clippy -- -D warnings 2>&1",
+            working_directory=project_dir,
+            max_output_lines=0,
+        ))
+        fmt_res, clippy_res = await asyncio.gather(fmt_task, clippy_task)
+        print()
+
+        report_step("FMT CHECK", fmt_res)
+        if fmt_res["exit_code"] != 0:
             print("    Format issues found! Run: cargo fmt")
         else:
             print("    All files formatted correctly")
         print()
 
-        # Step 3: Clippy lint
-        result = await run_step(
-            server, "CLIPPY", "cargo clippy -- -D warnings 2>&1",
-            working_directory=project_dir,
-        )
-        if result["exit_code"] != 0:
+        report_step("CLIPPY", clippy_res)
+        if clippy_res["exit_code"] != 0:
             print("    Clippy warnings found!")
         else:
             print("    No clippy warnings")
         print()
 
-        # Step 4: Run tests
-        result = await run_step(
-            server, "TEST", "cargo test 2>&1",
-            working_directory=project_dir,
-            max_output_lines=50,
+        # Steps 4 + 5: Run tests and build the release binary. Neither reads
+        # the other's artifacts, so submit both before waiting.
+        test_res, build_res = await asyncio.gather(
+            run_step(
+                server, "TEST", "cargo test 2>&1",
+                working_directory=project_dir,
+                max_output_lines=50,
+            ),
+            run_step(
+                server, "BUILD", "cargo build --release 2>&1",
+                working_directory=project_dir,
+                max_output_lines=0,
+            ),
         )
+        print()
+
+        report_step("TEST", test_res)
         # Extract test summary from output
-        all_lines = result["output_head"] + result["output_tail"]
-        test_results = [l for l in all_lines if "test result:" in l]
-        for line in test_results:
+        all_lines = test_res["output_head"] + test_res["output_tail"]
+        for line in filter(TEST_RESULT_RE.search, all_lines):
             print(f"    {line.strip()}")
         print()
 
-        # Step 5: Build release binary
-        result = await run_step(
-            server, "BUILD", "cargo build --release 2>&1",
-            working_directory=project_dir,
-        )
-        if result["exit_code"] == 0:
-            # Check binary size
-            size_result = await call(server, "run_command", {
-                "command": "ls -lh target/release/agentsh | awk '{print $5}'",
-                "working_directory": project_dir,
-            })
-            size = size_result["output_head"][0] if size_result["output_head"] else "unknown"
-            print(f"    Binary size: {size}")
+        report_step("BUILD", build_res)
+        if build_res["exit_code"] == 0:
+            # Check binary size locally; no need for another tool call.
+            size = AGENTSH_BIN.stat().st_size
+            print(f"    Binary size: {size / 1e6:.1f} MB")
         print()
 
         # Summary
-        print("=" * 60)
-        print("Pipeline Summary")
-        print("=" * 60)
-        commands = await call(server, "list_commands", {})
+        banner("Pipeline Summary")
+        # A shared server (see run_all.py) also tracks other examples'
+        # commands, so only summarize this pipeline's steps.
+        step_ids = {r["id"] for r in (result, fmt_res, clippy_res, test_res, build_res)}
+        commands = [
+            c for c in await call(server, "list_commands", {}) if c["id"] in step_ids
+        ]
         all_passed = True
+        lines = []
         for cmd in commands:
             icon = "PASS" if cmd["status"] == "completed" else "FAIL"
             if cmd["status"] != "completed":
                 all_passed = False
-            print(f"  [{icon}] {cmd['command'][:60]:<60} {cmd['runtime_seconds']:.1f}s")
+            lines.append(f"  [{icon}] {cmd['command'][:60]:<60} {cmd['runtime_seconds']:.1f}s")
+        sys.stdout.write("".join(f"{line}\n" for line in lines))
 
         print()
         if all_passed:
@@ -136,4 +147,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
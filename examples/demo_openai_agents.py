@@ -8,24 +8,18 @@ results back.
 Prerequisites:
   1. Build agentsh:    cargo build --release
   2. Set OPENAI_API_KEY in your environment
-  3. Install deps:     pip install openai-agents
+  3. Install deps:     pip install openai-agents  (optional: pip install uvloop)
   4. Run:              python examples/demo_openai_agents.py
 
 Reference: https://openai.github.io/openai-agents-python/mcp/
 """
 
-import asyncio
 import os
-from pathlib import Path
 
-from agents import Agent, Runner
-from agents.mcp import MCPServerStdio
+from _common import AGENTSH_BIN, agentsh_server, banner, run
 
-# Path to the agentsh binary (built with `cargo build --release`).
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
 
-
-async def main() -> None:
+async def main(server=None) -> None:
     if not AGENTSH_BIN.exists():
         print(f"Error: agentsh binary not found at {AGENTSH_BIN}")
         print("Build it first: cargo build --release")
@@ -35,16 +29,13 @@ async def main() -> None:
         print("Error: OPENAI_API_KEY environment variable is not set")
         return
 
-    # Launch agentsh as a stdio MCP server.
-    # The SDK spawns the process, keeps pipes open, and cleans up on exit.
-    async with MCPServerStdio(
-        name="agentsh",
-        params={
-            "command": str(AGENTSH_BIN),
-            "args": [],
-        },
-        cache_tools_list=True,
-    ) as server:
+    # Imported here so the checks above fail fast without loading the SDK.
+    from agents import Agent, Runner
+
+    # Launch agentsh as a stdio MCP server, unless the caller passed one in
+    # (see run_all.py). The SDK spawns the process, keeps pipes open, and
+    # cleans up on exit.
+    async with agentsh_server(server) as server:
         # Create an agent that has access to agentsh's tools.
         agent = Agent(
             name="DevOps Assistant",
@@ -63,9 +54,7 @@ use these tools. Always report the results clearly.""",
         )
 
         # --- Example 1: Simple command execution ---
-        print("=" * 60)
-        print("Example 1: Run a simple command")
-        print("=" * 60)
+        banner("Example 1: Run a simple command")
 
         result = await Runner.run(
             agent,
@@ -75,9 +64,7 @@ use these tools. Always report the results clearly.""",
         print()
 
         # --- Example 2: Command with structured output ---
-        print("=" * 60)
-        print("Example 2: List files and analyze output")
-        print("=" * 60)
+        banner("Example 2: List files and analyze output")
 
         result = await Runner.run(
             agent,
@@ -88,9 +75,7 @@ use these tools. Always report the results clearly.""",
         print()
 
         # --- Example 3: Command that fails ---
-        print("=" * 60)
-        print("Example 3: Handle a failing command")
-        print("=" * 60)
+        banner("Example 3: Handle a failing command")
 
         result = await Runner.run(
             agent,
@@ -100,9 +85,7 @@ use these tools. Always report the results clearly.""",
         print()
 
         # --- Example 4: Multi-step workflow ---
-        print("=" * 60)
-        print("Example 4: Multi-step workflow")
-        print("=" * 60)
+        banner("Example 4: Multi-step workflow")
 
         result = await Runner.run(
             agent,
@@ -115,4 +98,4 @@ use these tools. Always report the results clearly.""",
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -8,39 +8,24 @@ No API key needed.
 Usage:
   cargo build --release
   pip install openai-agents
+  pip install uvloop orjson  # optional, faster event loop and JSON parsing
   python examples/kill_and_timeout.py
 """
 
-import asyncio
-import json
-from pathlib import Path
+import sys
 
-from agents.mcp import MCPServerStdio
+from _common import agentsh_server, banner, call, call_raw, run, warm_up
 
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
+# One row of the list_commands listing; `.40` truncates the command.
+COMMAND_ROW = "  [{status:>10}] {id}: {command:.40}, {runtime_seconds:.1f}s\n".format
 
 
-async def call(server, tool: str, args: dict) -> dict:
-    result = await server.call_tool(tool, args)
-    return json.loads(result.content[0].text)
-
-
-async def call_raw(server, tool: str, args: dict) -> str:
-    """Return raw text (for error messages that aren't JSON)."""
-    result = await server.call_tool(tool, args)
-    return result.content[0].text
-
-
-async def main() -> None:
-    async with MCPServerStdio(
-        name="agentsh",
-        params={"command": str(AGENTSH_BIN), "args": []},
-    ) as server:
+async def main(server=None) -> None:
+    async with agentsh_server(server) as server:
+        await warm_up(server)
 
         # 1. Start a long-running process and kill it
-        print("=" * 60)
-        print("1. Start a long-running process and kill it")
-        print("=" * 60)
+        banner("1. Start a long-running process and kill it")
         await call(server, "start_command", {
             "command": "sleep 999",
             "id": "runaway",
@@ -61,12 +46,11 @@ async def main() -> None:
         print()
 
         # 2. Try to kill an already-completed process (should error)
-        print("=" * 60)
-        print("2. Try to kill an already-completed process")
-        print("=" * 60)
+        banner("2. Try to kill an already-completed process")
         await call(server, "start_command", {
             "command": "echo done",
             "id": "quick-one",
+            "max_output_lines": 0,
         })
         await call(server, "wait_command", {"id": "quick-one"})
         error_msg = await call_raw(server, "kill_command", {"id": "quick-one"})
@@ -74,9 +58,7 @@ async def main() -> None:
         print()
 
         # 3. Timeout via run_command
-        print("=" * 60)
-        print("3. Timeout via run_command (2s timeout on sleep 60)")
-        print("=" * 60)
+        banner("3. Timeout via run_command (2s timeout on sleep 60)")
         result = await call(server, "run_command", {
             "command": "sleep 60",
             "timeout_seconds": 2,
@@ -87,9 +69,7 @@ async def main() -> None:
         print()
 
         # 4. Timeout via start_command (process-level timeout)
-        print("=" * 60)
-        print("4. Process-level timeout (3s timeout on a 60s command)")
-        print("=" * 60)
+        banner("4. Process-level timeout (3s timeout on a 60s command)")
         await call(server, "start_command", {
             "command": "sleep 60",
             "id": "will-timeout",
@@ -103,9 +83,7 @@ async def main() -> None:
         print()
 
         # 5. A process that outputs before timing out
-        print("=" * 60)
-        print("5. Process with output before timeout")
-        print("=" * 60)
+        banner("5. Process with output before timeout")
         result = await call(server, "run_command", {
             "command": "echo 'starting...'; sleep 0.5; echo 'halfway'; sleep 60",
             "timeout_seconds": 2,
@@ -115,17 +93,13 @@ async def main() -> None:
         print()
 
         # 6. Verify cleanup -- list should show all completed/failed
-        print("=" * 60)
-        print("6. Final state of all commands")
-        print("=" * 60)
+        banner("6. Final state of all commands")
         commands = await call(server, "list_commands", {})
-        for cmd in commands:
-            print(f"  [{cmd['status']:>10}] {cmd['id']}: "
-                  f"{cmd['command'][:40]}, {cmd['runtime_seconds']:.1f}s")
+        sys.stdout.write("".join(COMMAND_ROW(**cmd) for cmd in commands))
         print()
 
         print("All kill/timeout examples completed successfully!")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
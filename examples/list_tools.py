@@ -7,44 +7,41 @@ the tools it exposes.
 Usage:
   cargo build --release
   pip install openai-agents
+  pip install uvloop  # optional, faster event loop
   python examples/list_tools.py
 """
 
-import asyncio
-from pathlib import Path
+import sys
 
-from agents.mcp import MCPServerStdio
+from _common import AGENTSH_BIN, agentsh_server, run
 
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
 
-
-async def main() -> None:
+async def main(server=None) -> None:
     if not AGENTSH_BIN.exists():
         print(f"Error: binary not found at {AGENTSH_BIN}")
         print("Build it first: cargo build --release")
         return
 
-    async with MCPServerStdio(
-        name="agentsh",
-        params={"command": str(AGENTSH_BIN), "args": []},
-    ) as server:
+    async with agentsh_server(server) as server:
         tools = await server.list_tools()
 
-        print(f"agentsh exposes {len(tools)} MCP tools:\n")
+        # Build the whole listing first and write it out in one go.
+        lines = [f"agentsh exposes {len(tools)} MCP tools:\n"]
         for tool in tools:
-            print(f"  {tool.name}")
-            print(f"    {tool.description}")
+            lines.append(f"  {tool.name}")
+            lines.append(f"    {tool.description}")
             if tool.inputSchema and "properties" in tool.inputSchema:
                 params = tool.inputSchema["properties"]
                 required = tool.inputSchema.get("required", [])
                 for name, schema in params.items():
                     req = " (required)" if name in required else ""
                     desc = schema.get("description", "")
-                    print(f"      - {name}: {schema.get('type', '?')}{req}")
+                    lines.append(f"      - {name}: {schema.get('type', '?')}{req}")
                     if desc:
-                        print(f"        {desc}")
-            print()
+                        lines.append(f"        {desc}")
+            lines.append("")
+        sys.stdout.write("\n".join(lines) + "\n")
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -0,0 +1,54 @@
+"""
+Run every example against a single agentsh server.
+
+Each example can spawn its own agentsh process, but running them one after
+another that way pays a process start and MCP handshake per example. This
+driver opens one server and passes it to each example's main().
+
+The OpenAI Agents demo returns early unless OPENAI_API_KEY is set. The build
+pipeline runs last since it exits non-zero on failure.
+
+Usage:
+  cargo build --release
+  pip install openai-agents
+  pip install uvloop orjson  # optional, faster event loop and JSON parsing
+  python examples/run_all.py
+"""
+
+import async_workflow
+import build_pipeline
+import demo_openai_agents
+import kill_and_timeout
+import list_tools
+import run_command_basics
+import system_info
+from _common import AGENTSH_BIN, agentsh_server, run, warm_up
+
+EXAMPLES = [
+    list_tools,
+    run_command_basics,
+    async_workflow,
+    kill_and_timeout,
+    system_info,
+    demo_openai_agents,
+    build_pipeline,
+]
+
+
+async def main() -> None:
+    if not AGENTSH_BIN.exists():
+        print(f"Error: binary not found at {AGENTSH_BIN}")
+        print("Build it first: cargo build --release")
+        return
+
+    async with agentsh_server() as server:
+        await warm_up(server)
+        for example in EXAMPLES:
+            print(f"### {example.__name__}")
+            print()
+            await example.main(server)
+            print()
+
+
+if __name__ == "__main__":
+    run(main())
@@ -7,38 +7,19 @@ No API key needed.
 Usage:
   cargo build --release
   pip install openai-agents
+  pip install uvloop orjson  # optional, faster event loop and JSON parsing
   python examples/run_command_basics.py
 """
 
-import asyncio
-import json
-from pathlib import Path
+from _common import agentsh_server, banner, call, run, warm_up
 
-from agents.mcp import MCPServerStdio
 
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
-
-
-def pretty(data: dict) -> str:
-    return json.dumps(data, indent=2)
-
-
-async def call(server, tool: str, args: dict) -> dict:
-    """Call an agentsh tool and return the parsed JSON result."""
-    result = await server.call_tool(tool, args)
-    return json.loads(result.content[0].text)
-
-
-async def main() -> None:
-    async with MCPServerStdio(
-        name="agentsh",
-        params={"command": str(AGENTSH_BIN), "args": []},
-    ) as server:
+async def main(server=None) -> None:
+    async with agentsh_server(server) as server:
+        await warm_up(server)
 
         # 1. Simple command
-        print("=" * 60)
-        print("1. Simple echo command")
-        print("=" * 60)
+        banner("1. Simple echo command")
         result = await call(server, "run_command", {"command": "echo 'hello world'"})
         print(f"  Exit code: {result['exit_code']}")
         print(f"  Output:    {result['output_head']}")
@@ -46,9 +27,7 @@ async def main() -> None:
         print()
 
         # 2. Multi-line output
-        print("=" * 60)
-        print("2. Multi-line output (seq 1 20)")
-        print("=" * 60)
+        banner("2. Multi-line output (seq 1 20)")
         result = await call(server, "run_command", {"command": "seq 1 20"})
         print(f"  Total lines: {result['total_lines']}")
         print(f"  Truncated:   {result['truncated']}")
@@ -56,9 +35,7 @@ async def main() -> None:
         print()
 
         # 3. Large output with windowing
-        print("=" * 60)
-        print("3. Large output windowed (seq 1 1000, max 30 lines)")
-        print("=" * 60)
+        banner("3. Large output windowed (seq 1 1000, max 30 lines)")
         result = await call(server, "run_command", {
             "command": "seq 1 1000",
             "max_output_lines": 30,
@@ -70,18 +47,14 @@ async def main() -> None:
         print()
 
         # 4. Command that fails
-        print("=" * 60)
-        print("4. Failing command (exit 42)")
-        print("=" * 60)
+        banner("4. Failing command (exit 42)")
         result = await call(server, "run_command", {"command": "exit 42"})
         print(f"  Exit code: {result['exit_code']}")
         print(f"  Timed out: {result['timed_out']}")
         print()
 
         # 5. Stderr capture
-        print("=" * 60)
-        print("5. Stderr capture")
-        print("=" * 60)
+        banner("5. Stderr capture")
         result = await call(server, "run_command", {
             "command": "echo 'to stdout'; echo 'to stderr' >&2",
         })
@@ -90,9 +63,7 @@ async def main() -> None:
         print()
 
         # 6. Error pattern detection
-        print("=" * 60)
-        print("6. Error pattern detection")
-        print("=" * 60)
+        banner("6. Error pattern detection")
         result = await call(server, "run_command", {
             "command": (
                 "echo 'Starting build...';"
@@ -109,9 +80,7 @@ async def main() -> None:
         print()
 
         # 7. Working directory
-        print("=" * 60)
-        print("7. Working directory (/tmp)")
-        print("=" * 60)
+        banner("7. Working directory (/tmp)")
         result = await call(server, "run_command", {
             "command": "pwd",
             "working_directory": "/tmp",
@@ -120,9 +89,7 @@ async def main() -> None:
         print()
 
         # 8. Timeout
-        print("=" * 60)
-        print("8. Timeout (sleep 30 with 1s timeout)")
-        print("=" * 60)
+        banner("8. Timeout (sleep 30 with 1s timeout)")
         result = await call(server, "run_command", {
             "command": "sleep 30",
             "timeout_seconds": 1,
@@ -136,4 +103,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -8,21 +8,24 @@ No API key needed.
 Usage:
   cargo build --release
   pip install openai-agents
+  pip install uvloop orjson  # optional, faster event loop and JSON parsing
   python examples/system_info.py
 """
 
 import asyncio
-import json
-from pathlib import Path
 
-from agents.mcp import MCPServerStdio
+from _common import agentsh_server, banner, call, run, warm_up
 
-AGENTSH_BIN = Path(__file__).parent.parent / "target" / "release" / "agentsh"
 
+async def _sem_wrap(sem: asyncio.Semaphore, coro):
+    async with sem:
+        return await coro
 
-async def call(server, tool: str, args: dict) -> dict:
-    result = await server.call_tool(tool, args)
-    return json.loads(result.content[0].text)
+
+async def bounded_gather(coros, limit: int = 8) -> list:
+    """Like asyncio.gather, but with at most `limit` awaitables in flight."""
+    sem = asyncio.Semaphore(limit)
+    return await asyncio.gather(*(_sem_wrap(sem, c) for c in coros))
 
 
 async def gather_info(server, label: str, command: str) -> str | None:
@@ -30,24 +33,22 @@ async def gather_info(server, label: str, command: str) -> str | None:
     result = await call(server, "run_command", {
         "command": command,
         "timeout_seconds": 10,
+        "max_output_lines": 1,
     })
     if result["exit_code"] == 0 and result["output_head"]:
         return result["output_head"][0]
     return None
 
 
-async def main() -> None:
-    async with MCPServerStdio(
-        name="agentsh",
-        params={"command": str(AGENTSH_BIN), "args": []},
-    ) as server:
+async def main(server=None) -> None:
+    async with agentsh_server(server) as server:
+        await warm_up(server)
 
-        print("=" * 60)
-        print("System Information Report")
-        print("=" * 60)
+        banner("System Information Report")
         print()
 
-        # Gather system info in parallel using start_command
+        # Gather system info with a single shell invocation: each probe's
+        # output is NUL-terminated so it can be split apart client-side.
         checks = {
             "os": "uname -s",
             "kernel": "uname -r",
@@ -60,23 +61,16 @@ async def main() -> None:
             "cpu_cores": "sysctl -n hw.ncpu 2>/dev/null || nproc 2>/dev/null || echo unknown",
             "memory": "sysctl -n hw.memsize 2>/dev/null || free -h 2>/dev/null | head -2 | tail -1",
         }
-
-        # Start all commands in parallel
-        for name, cmd in checks.items():
-            await call(server, "start_command", {
-                "command": cmd,
-                "id": f"info-{name}",
-                "timeout_seconds": 5,
-            })
-
-        # Wait for all and collect results
+        probes = " ".join(f'"$({{ {cmd}; }} 2>/dev/null)"' for cmd in checks.values())
+        result = await call(server, "run_command", {
+            "command": f"printf '%s\\0' {probes}",
+            "timeout_seconds": 5,
+        })
+        fields = "\n".join(result["output_head"] + result["output_tail"]).split("\0")
         info = {}
-        for name in checks:
-            result = await call(server, "wait_command", {"id": f"info-{name}"})
-            if result["exit_code"] == 0 and result["output_head"]:
-                info[name] = result["output_head"][0]
-            else:
-                info[name] = "N/A"
+        for name, value in zip(checks, fields):
+            lines = value.strip().splitlines()
+            info[name] = lines[0] if lines else "N/A"
 
         # Format human-readable memory
         if info.get("memory", "N/A") != "N/A":
@@ -100,9 +94,7 @@ async def main() -> None:
         print()
 
         # Tool versions
-        print("=" * 60)
-        print("Development Tools")
-        print("=" * 60)
+        banner("Development Tools")
         print()
 
         tools = {
@@ -116,11 +108,16 @@ async def main() -> None:
             "java": "java --version 2>&1 | head -1",
         }
 
-        for name, cmd in tools.items():
-            result = await call(server, "run_command", {
+        # Bounded so a growing tools list doesn't spawn every probe at once.
+        results = await bounded_gather([
+            call(server, "run_command", {
                 "command": cmd,
                 "timeout_seconds": 5,
+                "max_output_lines": 1,
             })
+            for cmd in tools.values()
+        ], limit=8)
+        for name, result in zip(tools, results):
             if result["exit_code"] == 0 and result["output_head"]:
                 version = result["output_head"][0]
                 print(f"  {name:>10}: {version}")
@@ -130,9 +127,7 @@ async def main() -> None:
         print()
 
         # Disk usage
-        print("=" * 60)
-        print("Disk Usage (top 5 by size)")
-        print("=" * 60)
+        banner("Disk Usage (top 5 by size)")
         print()
         result = await call(server, "run_command", {
             "command": "df -h 2>/dev/null | head -6",
@@ -145,4 +140,4 @@ async def main() -> None:
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())